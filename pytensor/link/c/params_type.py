@@ -125,8 +125,9 @@ for more info about enumeration aliases).
 
 """
 
+import functools
 import hashlib
-import re
+from operator import itemgetter
 
 from pytensor.graph.utils import MethodNotDefined
 from pytensor.link.c.type import CType, EnumType
@@ -136,105 +137,113 @@ from pytensor.link.c.type import CType, EnumType
 # - http://fr.cppreference.com/w/c/keyword
 # - http://fr.cppreference.com/w/cpp/keyword
 # Added `NULL` and `_Pragma` keywords.
-c_cpp_keywords = {
-    "_Alignas",
-    "_Alignof",
-    "_Atomic",
-    "_Bool",
-    "_Complex",
-    "_Generic",
-    "_Imaginary",
-    "_Noreturn",
-    "_Pragma",
-    "_Static_assert",
-    "_Thread_local",
-    "alignas",
-    "alignof",
-    "and",
-    "and_eq",
-    "asm",
-    "auto",
-    "bitand",
-    "bitor",
-    "bool",
-    "break",
-    "case",
-    "catch",
-    "char",
-    "char16_t",
-    "char32_t",
-    "class",
-    "compl",
-    "const",
-    "const_cast",
-    "constexpr",
-    "continue",
-    "decltype",
-    "default",
-    "delete",
-    "do",
-    "double",
-    "dynamic_cast",
-    "else",
-    "enum",
-    "explicit",
-    "export",
-    "extern",
-    "false",
-    "float",
-    "for",
-    "friend",
-    "goto",
-    "if",
-    "inline",
-    "int",
-    "long",
-    "mutable",
-    "namespace",
-    "new",
-    "noexcept",
-    "not",
-    "not_eq",
-    "NULL",
-    "nullptr",
-    "operator",
-    "or",
-    "or_eq",
-    "private",
-    "protected",
-    "public",
-    "register",
-    "reinterpret_cast",
-    "restrict",
-    "return",
-    "short",
-    "signed",
-    "sizeof",
-    "static",
-    "static_assert",
-    "static_cast",
-    "struct",
-    "switch",
-    "template",
-    "this",
-    "thread_local",
-    "throw",
-    "true",
-    "try",
-    "typedef",
-    "typeid",
-    "typename",
-    "union",
-    "unsigned",
-    "using",
-    "virtual",
-    "void",
-    "volatile",
-    "wchar_t",
-    "while",
-    "xor",
-    "xor_eq",
-}
+c_cpp_keywords = frozenset(
+    {
+        "_Alignas",
+        "_Alignof",
+        "_Atomic",
+        "_Bool",
+        "_Complex",
+        "_Generic",
+        "_Imaginary",
+        "_Noreturn",
+        "_Pragma",
+        "_Static_assert",
+        "_Thread_local",
+        "alignas",
+        "alignof",
+        "and",
+        "and_eq",
+        "asm",
+        "auto",
+        "bitand",
+        "bitor",
+        "bool",
+        "break",
+        "case",
+        "catch",
+        "char",
+        "char16_t",
+        "char32_t",
+        "class",
+        "compl",
+        "const",
+        "const_cast",
+        "constexpr",
+        "continue",
+        "decltype",
+        "default",
+        "delete",
+        "do",
+        "double",
+        "dynamic_cast",
+        "else",
+        "enum",
+        "explicit",
+        "export",
+        "extern",
+        "false",
+        "float",
+        "for",
+        "friend",
+        "goto",
+        "if",
+        "inline",
+        "int",
+        "long",
+        "mutable",
+        "namespace",
+        "new",
+        "noexcept",
+        "not",
+        "not_eq",
+        "NULL",
+        "nullptr",
+        "operator",
+        "or",
+        "or_eq",
+        "private",
+        "protected",
+        "public",
+        "register",
+        "reinterpret_cast",
+        "restrict",
+        "return",
+        "short",
+        "signed",
+        "sizeof",
+        "static",
+        "static_assert",
+        "static_cast",
+        "struct",
+        "switch",
+        "template",
+        "this",
+        "thread_local",
+        "throw",
+        "true",
+        "try",
+        "typedef",
+        "typeid",
+        "typename",
+        "union",
+        "unsigned",
+        "using",
+        "virtual",
+        "void",
+        "volatile",
+        "wchar_t",
+        "while",
+        "xor",
+        "xor_eq",
+    }
+)
+
+# Sentinel for attributes not found in ParamsType.get_params().
+_MISSING = object()
+
+# Struct names already generated, keyed by fields and types strings.
+_struct_name_cache: dict[tuple, str] = {}
 
 
 class Params(dict):
@@ -265,6 +274,15 @@ class Params(dict):
 
     """
 
+    def __new__(cls, params_type=None, *args, **kwargs):
+        # Params objects are instances of a subclass specialized for the fields
+        # of their ParamsType (see _params_class()).
+        # NB: params_type is missing when unpickling Params pickled by older
+        # versions, which are rebuilt by __setitem__() and __setstate__().
+        if cls is Params and isinstance(params_type, ParamsType):
+            cls = params_type._params_cls
+        return super().__new__(cls)
+
     def __init__(self, params_type, **kwargs):
         if not isinstance(params_type, ParamsType):
             raise TypeError("Params: 1st constructor argument should be a ParamsType.")
@@ -274,7 +292,13 @@ class Params(dict):
                     f'Params: ParamsType attribute "{field}" not in Params args.'
                 )
         super().__init__(**kwargs)
-        self.__dict__.update(__params_type__=params_type, __signatures__=None)
+        # __filtered__ tells if values were filtered by the ParamsType.
+        self.__dict__.update(
+            __params_type__=params_type,
+            __signatures__=None,
+            __hash_value__=None,
+            __filtered__=False,
+        )
 
     def __repr__(self):
         args = ", ".join(
@@ -282,52 +306,121 @@ class Params(dict):
         )
         return f"Params({args})"
 
+    def __reduce__(self):
+        # Specialized Params classes are created at runtime and can't be
+        # found by name, so we rebuild the object from its ParamsType.
+        return (_rebuild_params, (self.__params_type__, dict(self)))
+
+    def __setstate__(self, state):
+        # Only used for Params pickled by older versions.
+        params_type = state["__params_type__"]
+        self.__dict__.update(
+            __params_type__=params_type,
+            __signatures__=None,
+            __hash_value__=None,
+            __filtered__=False,
+        )
+        object.__setattr__(self, "__class__", params_type._params_cls)
+
     def __getattr__(self, key):
-        if key not in self:
-            raise AttributeError(f'Params: attribute "{key}" does not exist.')
-        return self[key]
+        try:
+            return dict.__getitem__(self, key)
+        except KeyError:
+            raise AttributeError(f'Params: attribute "{key}" does not exist.') from None
 
     def __setattr__(self, key, value):
         raise NotImplementedError("Params is immutable")
 
     def __setitem__(self, key, value):
-        raise NotImplementedError("Params is immutable")
+        # Items are only set by unpickling, before the state is restored.
+        if "__params_type__" in self.__dict__:
+            raise NotImplementedError("Params is immutable")
+        dict.__setitem__(self, key, value)
 
     def __delitem__(self, key):
         raise NotImplementedError("Params is immutable")
 
     def __hash__(self):
-        # As values are immutable, we can save data signatures the first time
-        # to not regenerate them in future hash() calls.
-        if self.__signatures__ is None:
-            # NB: For writing, we must bypass setattr() which is always called by default by Python.
-            self.__dict__["__signatures__"] = tuple(
-                # NB: Params object should have been already filtered.
-                self.__params_type__.types[i]
-                .make_constant(self[self.__params_type__.fields[i]])
-                .signature()
-                for i in range(self.__params_type__.length)
-            )
-        return hash((type(self), self.__params_type__, *self.__signatures__))
+        if self.__hash_value__ is None:
+            self._cache_hash()
+        return self.__hash_value__
+
+    def _cache_hash(self):
+        # As values are immutable, we can save data signatures and the resulting
+        # hash once to not regenerate them in future hash() calls.
+        # NB: Params object should have been already filtered.
+        params_type = self.__params_type__
+        signatures = tuple(
+            t.make_constant(self[f]).signature()
+            for f, t in zip(params_type.fields, params_type.types, strict=True)
+        )
+        # NB: For writing, we must bypass setattr() which is always called by default by Python.
+        self.__dict__.update(
+            __signatures__=signatures,
+            __hash_value__=hash((type(self), params_type, *signatures)),
+        )
 
     def __eq__(self, other):
-        return (
-            type(self) is type(other)
-            and self.__params_type__ == other.__params_type__
-            and all(
-                # NB: Params object should have been already filtered.
-                self.__params_type__.types[i].values_eq(
-                    self[self.__params_type__.fields[i]],
-                    other[self.__params_type__.fields[i]],
-                )
-                for i in range(self.__params_type__.length)
-            )
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return False
+        # Cached hashes (e.g. of filtered params) are a cheap way to detect differences.
+        if (
+            self.__hash_value__ is not None
+            and other.__hash_value__ is not None
+            and self.__hash_value__ != other.__hash_value__
+        ):
+            return False
+        params_type = self.__params_type__
+        return params_type == other.__params_type__ and all(
+            # NB: Params object should have been already filtered.
+            t.values_eq(self[f], other[f])
+            for f, t in zip(params_type.fields, params_type.types, strict=True)
         )
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
 
+# Params subclasses already generated, keyed by fields.
+_params_class_cache: dict[tuple[str, ...], type] = {}
+
+
+def _params_class(fields):
+    """Return the `Params` subclass with a direct attribute accessor per field."""
+    if fields in _params_class_cache:
+        return _params_class_cache[fields]
+    # Fields shadowing an existing attribute (e.g. dict methods) or Params
+    # internal attributes are still resolved through Params.__getattr__().
+    accessors = {
+        field: property(itemgetter(field))
+        for field in fields
+        if not (field.startswith("__") or hasattr(Params, field))
+    }
+    cls = type("Params", (Params,), {"__slots__": (), **accessors})
+    _params_class_cache[fields] = cls
+    return cls
+
+
+def _rebuild_params(params_type, values):
+    return Params(params_type, **values)
+
+
+# Same types are often wrapped under the same field name in many ParamsTypes,
+# so we cache the generated extraction methods. We use typed=True as
+# equal types of different classes may generate different C code.
+@functools.lru_cache(maxsize=4096, typed=True)
+def _c_extract_method(attribute_name, type_instance, fail):
+    """Return the C code of the struct method extracting field `attribute_name`."""
+    sub = {"fail": fail}
+    return f"""
+            void extract_{attribute_name}(PyObject* py_{attribute_name}) {{
+                {type_instance.c_extract(attribute_name, sub)}
+            }}
+            """
+
+
 class ParamsType(CType):
     """
     This class can create a struct of PyTensor types (like `TensorType`, etc.)
@@ -355,12 +448,29 @@ class ParamsType(CType):
 
     """
 
+    # Instance attributes are fixed, so we store them in slots. Base classes
+    # still provide a ``__dict__``, kept for any extra attribute.
+    __slots__ = (
+        "_alias_values",
+        "_c_code_cache",
+        "_const_values",
+        "_field_to_idx",
+        "_hash",
+        "_params_cls",
+        "_type_to_idx",
+        "fields",
+        "length",
+        "name",
+        "types",
+    )
+
     def __init__(self, **kwargs):
         if len(kwargs) == 0:
             raise ValueError("Cannot create ParamsType from empty data.")
 
         for attribute_name in kwargs:
-            if re.match("^[A-Za-z_][A-Za-z0-9_]*$", attribute_name) is None:
+            # Attribute names must be valid ASCII identifiers to be usable in C code.
+            if not (attribute_name.isidentifier() and attribute_name.isascii()):
                 raise AttributeError(
                     f'ParamsType: attribute "{attribute_name}" should be a valid identifier.'
                 )
@@ -379,9 +489,9 @@ class ParamsType(CType):
         self.fields = tuple(sorted(kwargs))
         self.types = tuple(kwargs[field] for field in self.fields)
         self.name = self.generate_struct_name()
+        self._build_index_maps()
+        self._init_caches()
 
-        self.__const_to_enum = {}
-        self.__alias_to_enum = {}
         enum_types = [t for t in self.types if isinstance(t, EnumType)]
         if enum_types:
             # We don't want same enum names in different enum types.
@@ -405,64 +515,137 @@ class ParamsType(CType):
                 raise AttributeError(
                     "ParamsType: found aliases that have same names as constants."
                 )
-            # We map each enum name to the enum type in which it is defined.
-            # We will then use this dict to find enum value when looking for enum name in ParamsType object directly.
-            self.__const_to_enum = {
-                enum_name: enum_type
-                for enum_type in enum_types
-                for enum_name in enum_type
-            }
-            self.__alias_to_enum = {
-                alias: enum_type
-                for enum_type in enum_types
-                for alias in enum_type.aliases
-            }
+
+        self._build_enum_values()
+
+        # ParamsType is immutable, so its hash can be computed only once.
+        self._hash = hash((type(self), self.fields, self.types))
+
+    def __getstate__(self):
+        # Slots are not part of ``__dict__``, so we pickle them explicitly.
+        state = dict(self.__dict__)
+        for slot in self.__slots__:
+            # Runtime caches are rebuilt when unpickling (see _init_caches()).
+            if slot in ("_c_code_cache", "_params_cls"):
+                continue
+            state[slot] = object.__getattribute__(self, slot)
+        return state
 
     def __setstate__(self, state):
         # NB:
         # I have overridden __getattr__ to make enum constants available through
         # the ParamsType when it contains enum types. To do that, I use some internal
-        # attributes: self.__const_to_enum and self.__alias_to_enum. These attributes
+        # attributes: self._const_values and self._alias_values. These attributes
         # are normally found by Python without need to call getattr(), but when the
         # ParamsType is unpickled, it seems gettatr() may be called at a point before
-        # __const_to_enum or __alias_to_enum are unpickled, so that gettatr() can't find
+        # _const_values or _alias_values are unpickled, so that gettatr() can't find
         # those attributes, and then loop infinitely.
         # For this reason, I must add this trivial implementation of __setstate__()
         # to avoid errors when unpickling.
-        self.__dict__.update(state)
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+        # Hashes of strings are not stable across Python processes,
+        # so a pickled hash value must not be reused.
+        self._hash = hash((type(self), self.fields, self.types))
+        if "_field_to_idx" not in state or "_type_to_idx" not in state:
+            self._build_index_maps()
+        if "_const_values" not in state or "_alias_values" not in state:
+            self._build_enum_values()
+        self._init_caches()
+
+    def _build_index_maps(self):
+        # Map each field to its position, and each type to the position
+        # of the first field using it (fields are sorted), for constant-time
+        # lookups in get_type() and get_field().
+        self._field_to_idx = {field: i for i, field in enumerate(self.fields)}
+        self._type_to_idx = {}
+        for i, t in enumerate(self.types):
+            self._type_to_idx.setdefault(t, i)
+
+    def _build_enum_values(self):
+        # We map each enum name and each alias to its value. We will then use these
+        # dicts to find enum value when looking for enum name in ParamsType object directly.
+        enum_types = [t for t in self.types if isinstance(t, EnumType)]
+        self._const_values = {
+            enum_name: enum_type[enum_name]
+            for enum_type in enum_types
+            for enum_name in enum_type
+        }
+        self._alias_values = {
+            alias: enum_type.fromalias(alias)
+            for enum_type in enum_types
+            for alias in enum_type.aliases
+        }
+
+    def _init_caches(self):
+        # The Params class is generated at runtime and can't be pickled.
+        self._params_cls = _params_class(self.fields)
+        # Result of c_support_code(), which is costly to generate.
+        self._c_code_cache = {}
+
+    def _collect_c_code(self, method_name, kwargs):
+        # NB: Results are not cached, as wrapped types may depend on config
+        # flags that can change (e.g. ScalarType and lib__amdlibm).
+        # Wrapped types often share the same entries, so we remove duplicates
+        # while keeping the order (the C linker does the same on its side).
+        return list(
+            dict.fromkeys(
+                item
+                for _type in self.types
+                for item in getattr(_type, method_name)(**kwargs)
+            )
+        )
 
     def __getattr__(self, key):
         # Now we can access value of each enum defined inside enum types wrapped into the current ParamsType.
-        if key in self.__const_to_enum:
-            return self.__const_to_enum[key][key]
-        return super().__getattr__(self, key)
+        # NB: We read the slot directly, so that a lookup before _const_values is set
+        # (e.g. while unpickling) raises AttributeError instead of recursing.
+        try:
+            const_values = object.__getattribute__(self, "_const_values")
+        except AttributeError:
+            const_values = {}
+        if key in const_values:
+            return const_values[key]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{key}'")
 
     def __repr__(self):
         args = ", ".join(
-            f"{self.fields[i]}:{self.types[i]}" for i in range(self.length)
+            f"{f}:{t}" for f, t in zip(self.fields, self.types, strict=True)
         )
         return f"ParamsType<{args}>"
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        # Hash and struct name are cheap to compare and differ in most cases.
+        # The struct name only uses types strings, so types must still be compared.
         return (
             type(self) is type(other)
+            and self._hash == other._hash
+            and self.name == other.name
             and self.fields == other.fields
             and self.types == other.types
         )
 
     def __hash__(self):
-        return hash((type(self), *self.fields, *self.types))
+        return self._hash
 
     def generate_struct_name(self):
         # This method tries to generate an unique name for the current instance.
         # This name is intended to be used as struct name in C code and as constant
         # definition to check if a similar ParamsType has already been created
         # (see c_support_code() below).
-        fields_string = ",".join(self.fields).encode("utf-8")
-        types_string = ",".join(str(t) for t in self.types).encode("utf-8")
+        # The name only depends on fields and types strings, so we cache it.
+        key = (self.fields, tuple(str(t) for t in self.types))
+        if key in _struct_name_cache:
+            return _struct_name_cache[key]
+        fields_string = ",".join(key[0]).encode("utf-8")
+        types_string = ",".join(key[1]).encode("utf-8")
         fields_hex = hashlib.sha256(fields_string).hexdigest()
         types_hex = hashlib.sha256(types_string).hexdigest()
-        return f"_Params_{fields_hex}_{types_hex}"
+        struct_name = f"_Params_{fields_hex}_{types_hex}"
+        _struct_name_cache[key] = struct_name
+        return struct_name
 
     def has_type(self, pytensor_type):
         """
@@ -477,7 +660,10 @@ class ParamsType(CType):
         in the current ParamsType.
 
         """
-        return self.types[self.fields.index(field_name)]
+        try:
+            return self.types[self._field_to_idx[field_name]]
+        except KeyError:
+            raise ValueError(f"{field_name!r} is not a field of {self}") from None
 
     def get_field(self, pytensor_type):
         """
@@ -491,7 +677,10 @@ class ParamsType(CType):
         PyTensor type only once.
 
         """
-        return self.fields[self.types.index(pytensor_type)]
+        try:
+            return self.fields[self._type_to_idx[pytensor_type]]
+        except KeyError:
+            raise ValueError(f"{pytensor_type} is not a type of {self}") from None
 
     def get_enum(self, key):
         """
@@ -519,7 +708,7 @@ class ParamsType(CType):
             print(wrapper.TWO)
 
         """
-        return self.__const_to_enum[key][key]
+        return self._const_values[key]
 
     def enum_from_alias(self, alias):
         """
@@ -540,7 +729,9 @@ class ParamsType(CType):
             wrapper = ParamsType(
                 scalar=ScalarType("int32"),
                 letters=EnumType(A=(1, "alpha"), B=(2, "beta"), C=3),
-                digits=EnumList(("ZERO", "nothing"), ("ONE", "unit"), ("TWO", "couple")),
+                digits=EnumList(
+                    ("ZERO", "nothing"), ("ONE", "unit"), ("TWO", "couple")
+                ),
             )
             print(wrapper.get_enum("C"))  # 3
             print(wrapper.get_enum("TWO"))  # 2
@@ -558,11 +749,9 @@ class ParamsType(CType):
             method to do that.
 
         """
-        return (
-            self.__alias_to_enum[alias].fromalias(alias)
-            if alias in self.__alias_to_enum
-            else self.__const_to_enum[alias][alias]
-        )
+        if alias in self._alias_values:
+            return self._alias_values[alias]
+        return self._const_values[alias]
 
     def get_params(self, *objects, **kwargs) -> Params:
         """
@@ -593,7 +782,9 @@ class ParamsType(CType):
                     self.b = numpy.asarray([[1, 2, 3], [4, 5, 6]])
 
 
-            params_type = ParamsType(a=ScalarType("int32"), b=dmatrix, c=ScalarType("bool"))
+            params_type = ParamsType(
+                a=ScalarType("int32"), b=dmatrix, c=ScalarType("bool")
+            )
 
             o = MyObject()
             value_for_c = False
@@ -606,28 +797,26 @@ class ParamsType(CType):
             print(params)
 
         """
+        fields = self.fields
         fields_values = dict()
         # We collect fields values from given objects.
         # If a field is present in many objects, only the field in the last object will be retained.
         for obj in objects:
-            for field in self.fields:
-                try:
-                    fields_values[field] = getattr(obj, field)
-                except Exception:
-                    pass
+            for field in fields:
+                value = getattr(obj, field, _MISSING)
+                if value is not _MISSING:
+                    fields_values[field] = value
         # We then collect fields values from given kwargs.
         # A field value in kwargs will replace any previous value collected from objects for this field.
-        for field in self.fields:
+        for field in fields:
             if field in kwargs:
                 fields_values[field] = kwargs[field]
         # Then we filter the fields values and we create the Params object.
         filtered = {
-            self.fields[i]: self.types[i].filter(
-                fields_values[self.fields[i]], strict=False, allow_downcast=True
-            )
-            for i in range(self.length)
+            f: t.filter(fields_values[f], strict=False, allow_downcast=True)
+            for f, t in zip(fields, self.types, strict=True)
         }
-        return Params(self, **filtered)
+        return self._filtered_params(filtered)
 
     def extended(self, **kwargs):
         """
@@ -637,86 +826,82 @@ class ParamsType(CType):
         ParamsType constructor.
 
         """
-        self_to_dict = {self.fields[i]: self.types[i] for i in range(self.length)}
+        self_to_dict = dict(zip(self.fields, self.types, strict=True))
         self_to_dict.update(kwargs)
         return ParamsType(**self_to_dict)
 
     # Returns a Params object with expected attributes or (in strict mode) checks that data has expected attributes.
     def filter(self, data, strict=False, allow_downcast=None):
+        # Params already filtered by this ParamsType need no further check.
+        if (
+            isinstance(data, Params)
+            and data.__params_type__ is self
+            and data.__filtered__
+        ):
+            return data
         if strict and not isinstance(data, Params):
             raise TypeError(
                 f"{self}: strict mode: data should be an instance of Params."
             )
         # Filter data attributes to check if they respect the ParamsType's contract.
         filtered = {
-            self.fields[i]: self.types[i].filter(
-                getattr(data, self.fields[i]), strict, allow_downcast
-            )
-            for i in range(self.length)
+            f: t.filter(getattr(data, f), strict, allow_downcast)
+            for f, t in zip(self.fields, self.types, strict=True)
         }
-        return (
-            data if (strict or isinstance(data, Params)) else Params(self, **filtered)
-        )
+        if strict or isinstance(data, Params):
+            return data
+        return self._filtered_params(filtered)
+
+    def _filtered_params(self, filtered):
+        # Create a Params object from values already filtered by this ParamsType.
+        params = self._params_cls(self, **filtered)
+        # Params are almost always hashed (e.g. by the C linker),
+        # so we compute the hash right away, if values are hashable.
+        try:
+            params._cache_hash()
+        except TypeError:
+            pass
+        # NB: For writing, we must bypass Params.__setattr__().
+        params.__dict__["__filtered__"] = True
+        return params
 
     def values_eq(self, a, b):
         return all(
-            self.types[i].values_eq(
-                getattr(a, self.fields[i]), getattr(b, self.fields[i])
-            )
-            for i in range(self.length)
+            t.values_eq(getattr(a, f), getattr(b, f))
+            for f, t in zip(self.fields, self.types, strict=True)
         )
 
     def values_eq_approx(self, a, b):
         return all(
-            self.types[i].values_eq_approx(
-                getattr(a, self.fields[i]), getattr(b, self.fields[i])
-            )
-            for i in range(self.length)
+            t.values_eq_approx(getattr(a, f), getattr(b, f))
+            for f, t in zip(self.fields, self.types, strict=True)
         )
 
     def c_compile_args(self, **kwargs):
-        c_compile_args_list = []
-        for _type in self.types:
-            c_compile_args_list.extend(_type.c_compile_args(**kwargs))
-        return c_compile_args_list
+        return self._collect_c_code("c_compile_args", kwargs)
 
     def c_no_compile_args(self, **kwargs):
-        c_no_compile_args_list = []
-        for _type in self.types:
-            c_no_compile_args_list.extend(_type.c_no_compile_args(**kwargs))
-        return c_no_compile_args_list
+        return self._collect_c_code("c_no_compile_args", kwargs)
 
     def c_headers(self, **kwargs):
-        c_headers_list = []
-        for _type in self.types:
-            c_headers_list.extend(_type.c_headers(**kwargs))
-        return c_headers_list
+        return self._collect_c_code("c_headers", kwargs)
 
     def c_libraries(self, **kwargs):
-        c_libraries_list = []
-        for _type in self.types:
-            c_libraries_list.extend(_type.c_libraries(**kwargs))
-        return c_libraries_list
+        return self._collect_c_code("c_libraries", kwargs)
 
     def c_header_dirs(self, **kwargs):
-        c_header_dirs_list = []
-        for _type in self.types:
-            c_header_dirs_list.extend(_type.c_header_dirs(**kwargs))
-        return c_header_dirs_list
+        return self._collect_c_code("c_header_dirs", kwargs)
 
     def c_lib_dirs(self, **kwargs):
-        c_lib_dirs_list = []
-        for _type in self.types:
-            c_lib_dirs_list.extend(_type.c_lib_dirs(**kwargs))
-        return c_lib_dirs_list
+        return self._collect_c_code("c_lib_dirs", kwargs)
 
     def c_init_code(self, **kwargs):
-        c_init_code_list = []
-        for _type in self.types:
-            c_init_code_list.extend(_type.c_init_code(**kwargs))
-        return c_init_code_list
+        return self._collect_c_code("c_init_code", kwargs)
 
     def c_support_code(self, **kwargs):
+        # The generated code does not depend on kwargs, so we build it only once.
+        if "c_support_code" in self._c_code_cache:
+            return list(self._c_code_cache["c_support_code"])
         sub = {"fail": "{this->setErrorOccurred(); return;}"}
         struct_name = self.name
         struct_name_defined = struct_name.upper()
@@ -742,11 +927,7 @@ class ParamsType(CType):
             c_cleanup_list.append(type_instance.c_cleanup(attribute_name, sub))
 
             c_extract_list.append(
-                f"""
-            void extract_{attribute_name}(PyObject* py_{attribute_name}) {{
-                {type_instance.c_extract(attribute_name, sub)}
-            }}
-            """
+                _c_extract_method(attribute_name, type_instance, sub["fail"])
             )
 
         struct_declare = "\n".join(c_declare_list)
@@ -754,8 +935,8 @@ class ParamsType(CType):
         struct_cleanup = "\n".join(c_cleanup_list)
         struct_extract = "\n\n".join(c_extract_list)
         args = "\n".join(
-            f"case {i}: extract_{self.fields[i]}(object); break;"
-            for i in range(self.length)
+            f"case {i}: extract_{field}(object); break;"
+            for i, field in enumerate(self.fields)
         )
         struct_extract_method = f"""
         void extract(PyObject* object, int field_pos) {{
@@ -814,10 +995,12 @@ class ParamsType(CType):
         /** End ParamsType {struct_name} **/
         """
 
-        return [*sorted(c_support_code_set), final_struct_code]
+        result = (*sorted(c_support_code_set), final_struct_code)
+        self._c_code_cache["c_support_code"] = result
+        return list(result)
 
     def c_code_cache_version(self):
-        return ((3,), tuple(t.c_code_cache_version() for t in self.types))
+        return ((4,), tuple(t.c_code_cache_version() for t in self.types))
 
     # As this struct has constructor and destructor, it could be instantiated
     # on stack, but current implementations of C ops will then pass the
@@ -843,31 +1026,35 @@ class ParamsType(CType):
         """
 
     def c_extract(self, name, sub, check_input=True, **kwargs):
-        fields_list = ", ".join(f'"{x}"' for x in self.fields)
+        # The fields are known at code generation time, so we call each field's
+        # extract method directly instead of looping through `extract(o, i)`.
+        fields_extract = "\n".join(
+            f"""
+        o = PyDict_GetItemString(py_{name}, "{field}");
+        if (o == NULL) {{
+            PyErr_Format(PyExc_TypeError, "ParamsType: missing expected attribute \\"%s\\" in object.", "{field}");
+            {sub["fail"]}
+        }}
+        {name}->extract_{field}(o);
+        if ({name}->errorOccurred()) {{
+            /* The extract code from attribute type should have already raised a Python exception,
+             * so we just print the attribute name in stderr. */
+            fprintf(stderr, "\\nParamsType: error when extracting value for attribute \\"%s\\".\\n", "{field}");
+            {sub["fail"]}
+        }}"""
+            for field in self.fields
+        )
         return f"""
         /* Seems c_init() is not called for a op param. So I call `new` here. */
         {name} = new {self.name};
 
         {{ // This need a separate namespace for Clinker
-        const char* fields[] = {{{fields_list}}};
+        PyObject* o;
         if (py_{name} == Py_None) {{
             PyErr_SetString(PyExc_ValueError, "ParamsType: expected an object, not None.");
-            {sub['fail']}
-        }}
-        for (int i = 0; i < {self.length}; ++i) {{
-            PyObject* o = PyDict_GetItemString(py_{name}, fields[i]);
-            if (o == NULL) {{
-                PyErr_Format(PyExc_TypeError, "ParamsType: missing expected attribute \\"%s\\" in object.", fields[i]);
-                {sub['fail']}
-            }}
-            {name}->extract(o, i);
-            if ({name}->errorOccurred()) {{
-                /* The extract code from attribute type should have already raised a Python exception,
-                 * so we just print the attribute name in stderr. */
-                fprintf(stderr, "\\nParamsType: error when extracting value for attribute \\"%s\\".\\n", fields[i]);
-                {sub['fail']}
-            }}
+            {sub["fail"]}
         }}
+        {fields_extract}
         }}
         """
 
@@ -2,6 +2,7 @@ import jax
 import jax.numpy as jnp
 
 from pytensor.link.jax.dispatch.basic import jax_funcify
+from pytensor.scalar import basic as ps
 from pytensor.tensor.elemwise import CAReduce, DimShuffle, Elemwise
 from pytensor.tensor.special import LogSoftmax, Softmax, SoftmaxGrad
 
@@ -20,6 +21,19 @@ def jax_funcify_Elemwise(op, node, **kwargs):
     return elemwise_fn
 
 
+# These lower to the dedicated XLA reductions, instead of a `jax.lax.reduce`
+# with a generic computation.
+_lax_reductions = {
+    ps.Add: jax.lax.reduce_sum,
+    ps.Mul: jax.lax.reduce_prod,
+    ps.ScalarMaximum: jax.lax.reduce_max,
+    ps.ScalarMinimum: jax.lax.reduce_min,
+    ps.AND: jax.lax.reduce_and,
+    ps.OR: jax.lax.reduce_or,
+    ps.XOR: jax.lax.reduce_xor,
+}
+
+
 @jax_funcify.register(CAReduce)
 def jax_funcify_CAReduce(op, **kwargs):
     axis = op.axis
@@ -28,6 +42,7 @@ def jax_funcify_CAReduce(op, **kwargs):
     scalar_op_name = getattr(op.scalar_op, "name", None)
     scalar_op_identity = getattr(op.scalar_op, "identity", None)
     acc_dtype = getattr(op, "acc_dtype", None)
+    lax_reduction = _lax_reductions.get(type(op.scalar_op))
 
     def careduce(x):
         nonlocal \
@@ -57,7 +72,9 @@ def jax_funcify_CAReduce(op, **kwargs):
 
         to_reduce = sorted(axis, reverse=True)
 
-        if to_reduce:
+        if to_reduce and lax_reduction is not None:
+            return lax_reduction(x, to_reduce).astype(acc_dtype)
+        elif to_reduce:
             # In this case, we need to use the `jax.lax` function (if there
             # is one), and not the `jnp` version.
             jax_op = getattr(jax.lax, scalar_fn_name)
@@ -71,15 +88,23 @@ def jax_funcify_CAReduce(op, **kwargs):
 
 @jax_funcify.register(DimShuffle)
 def jax_funcify_DimShuffle(op, **kwargs):
-    def dimshuffle(x):
-        res = jnp.transpose(x, op.transposition)
+    # We use transpose, squeeze and expand_dims instead of a reshape, as these
+    # are simpler layout operations for XLA. Dropped dimensions are moved
+    # last by the transposition.
+    transposition = tuple(op.transposition)
+    is_permutation = transposition != tuple(range(len(transposition)))
+    drop = tuple(range(len(op.shuffle), len(transposition)))
+    augment = tuple(op.augment)
 
-        shape = list(res.shape[: len(op.shuffle)])
-
-        for augm in op.augment:
-            shape.insert(augm, 1)
-
-        return jnp.reshape(res, shape)
+    def dimshuffle(x):
+        res = x
+        if is_permutation:
+            res = jnp.transpose(res, transposition)
+        if drop:
+            res = jnp.squeeze(res, axis=drop)
+        if augment:
+            res = jnp.expand_dims(res, axis=augment)
+        return res
 
     return dimshuffle
 
@@ -1,8 +1,51 @@
 import jax.numpy as jnp
+import jax.scipy.special
 import numpy as np
+import scipy.special
 
+from pytensor.graph.basic import Apply
+from pytensor.graph.op import Op
 from pytensor.link.jax.dispatch import jax_funcify
+from pytensor.tensor.basic import as_tensor_variable
 from pytensor.tensor.math import Argmax, Dot, Max
+from pytensor.tensor.type import TensorType
+
+
+class JAXLogSumExp(Op):
+    """Dummy `Op` that represents ``log(sum(exp(x), axis=axis))``.
+
+    It is introduced by a JAX specific rewrite, so that the whole expression
+    is lowered to a single call to `jax.scipy.special.logsumexp`.
+
+    """
+
+    __props__ = ("axis",)
+
+    def __init__(self, axis=None):
+        self.axis = None if axis is None else tuple(axis)
+
+    def make_node(self, x):
+        x = as_tensor_variable(x)
+        axis = range(x.type.ndim) if self.axis is None else self.axis
+        out_shape = tuple(s for i, s in enumerate(x.type.shape) if i not in axis)
+        return Apply(self, [x], [TensorType(x.type.dtype, shape=out_shape)()])
+
+    def perform(self, node, inputs, output_storage):
+        [x] = inputs
+        output_storage[0][0] = np.asarray(
+            scipy.special.logsumexp(x, axis=self.axis),
+            dtype=node.outputs[0].type.dtype,
+        )
+
+
+@jax_funcify.register(JAXLogSumExp)
+def jax_funcify_JAXLogSumExp(op, **kwargs):
+    axis = op.axis
+
+    def logsumexp(x):
+        return jax.scipy.special.logsumexp(x, axis=axis)
+
+    return logsumexp
 
 
 @jax_funcify.register(Dot)
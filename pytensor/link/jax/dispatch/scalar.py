@@ -104,16 +104,17 @@ def jax_funcify_ScalarOp(op, node, **kwargs):
         # Some Scalar Ops accept multiple number of inputs, behaving as a variadic function,
         # even though the base Op from `func_name` is specified as a binary Op.
         # This happens with `Add`, which can work as a `Sum` for multiple scalars.
-        jax_variadic_func = getattr(jnp, op.nfunc_variadic, None)
-        if not jax_variadic_func:
+        # We chain the binary function instead of reducing over the stacked inputs,
+        # which would materialize all of them broadcasted to the output shape.
+        if getattr(op, "nfunc_variadic", None) is None:
             raise NotImplementedError(
                 f"Dispatch not implemented for Scalar Op {op} with {len(node.inputs)} inputs"
             )
 
+        binary_func = jax_func
+
         def jax_func(*args):
-            return jax_variadic_func(
-                jnp.stack(jnp.broadcast_arrays(*args), axis=0), axis=0
-            )
+            return functools.reduce(binary_func, args)
 
     return jax_func
 
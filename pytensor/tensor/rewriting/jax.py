@@ -3,7 +3,7 @@ from pytensor.compile import optdb
 from pytensor.graph.rewriting.basic import in2out, node_rewriter
 from pytensor.tensor.basic import MakeVector
 from pytensor.tensor.elemwise import DimShuffle
-from pytensor.tensor.math import Sum
+from pytensor.tensor.math import Sum, add, exp, log, sub
 from pytensor.tensor.shape import Reshape
 from pytensor.tensor.subtensor import AdvancedIncSubtensor, AdvancedSubtensor
 from pytensor.tensor.variable import TensorVariable
@@ -148,3 +148,109 @@ optdb.register(
     "jax",
     position=100,
 )
+
+
+def _strip_expand_dims(var):
+    """Return the input and `Op` of the expand dims `DimShuffle` that created `var`, if any."""
+    if (
+        var.owner is not None
+        and isinstance(var.owner.op, DimShuffle)
+        and var.owner.op.is_expand_dims
+    ):
+        return var.owner.inputs[0], var.owner.op
+    return var, None
+
+
+@node_rewriter([log])
+def log_sum_exp(fgraph, node):
+    """Replace ``log(sum(exp(x)))`` by a `JAXLogSumExp` `Op`.
+
+    XLA would otherwise receive separate elementwise and reduction operations,
+    whereas `jax.scipy.special.logsumexp` computes the whole (stabilized)
+    expression at once.
+
+    """
+    from pytensor.link.jax.dispatch.math import JAXLogSumExp
+
+    # If the sum has keepdims=True, there might be a dimshuffle
+    sum_out, expand_dims_op = _strip_expand_dims(node.inputs[0])
+    sum_node = sum_out.owner
+    if sum_node is None or not isinstance(sum_node.op, Sum):
+        return None
+
+    exp_node = sum_node.inputs[0].owner
+    if exp_node is None or exp_node.op != exp:
+        return None
+
+    [x] = exp_node.inputs
+    if sum_out.type.dtype != x.type.dtype:
+        return None
+
+    out = JAXLogSumExp(sum_node.op.axis)(x)
+    if expand_dims_op is not None:
+        out = expand_dims_op(out)
+    if out.type.broadcastable != node.outputs[0].type.broadcastable:
+        return None
+    return [out]
+
+
+@node_rewriter([add])
+def log_sum_exp_offset(fgraph, node):
+    """Replace ``logsumexp(x - c) + c`` by ``logsumexp(x)``.
+
+    This is the usual manual stabilization of ``log(sum(exp(x)))``, where ``c``
+    is constant along the reduced axes (e.g. ``max(x, keepdims=True)``). It is
+    useless once the expression is computed by `JAXLogSumExp`, which is already
+    stable.
+
+    """
+    from pytensor.link.jax.dispatch.math import JAXLogSumExp
+
+    if len(node.inputs) != 2:
+        return None
+
+    for lse_out, offset in (node.inputs, node.inputs[::-1]):
+        lse_out_no_expand, expand_dims_op = _strip_expand_dims(lse_out)
+        lse_node = lse_out_no_expand.owner
+        if lse_node is None or not isinstance(lse_node.op, JAXLogSumExp):
+            continue
+
+        sub_node = lse_node.inputs[0].owner
+        if sub_node is None or sub_node.op != sub or sub_node.inputs[1] is not offset:
+            continue
+
+        x = sub_node.inputs[0]
+        axis = lse_node.op.axis
+        if axis is None:
+            axis = range(x.type.ndim)
+        # The result must be expanded back exactly in the reduced axes (as with
+        # keepdims=True), so that it lines up with the offset.
+        augment = expand_dims_op.augment if expand_dims_op is not None else ()
+        if tuple(augment) != tuple(sorted(axis)):
+            continue
+        # The offset must not change along reduced axes, nor broadcast `x`.
+        if not (
+            offset.type.ndim == x.type.ndim
+            and all(offset.type.broadcastable[i] for i in axis)
+            and sub_node.outputs[0].type.broadcastable == x.type.broadcastable
+        ):
+            continue
+
+        out = lse_node.op(x)
+        if expand_dims_op is not None:
+            out = expand_dims_op(out)
+        if out.type != node.outputs[0].type:
+            continue
+        return [out]
+
+    return None
+
+
+# Registered before "stabilize", which would otherwise rewrite `log(sum(exp(x)))`
+# into the equivalent stable expression with separate operations.
+optdb.register(
+    "jax_log_sum_exp",
+    in2out(log_sum_exp, log_sum_exp_offset),
+    "jax",
+    position=1.4,
+)
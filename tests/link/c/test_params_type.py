@@ -1,9 +1,15 @@
+import copyreg
+import io
+import pickle
+
 import numpy as np
 import pytest
 
 import pytensor
 from pytensor import tensor as pt
+from pytensor.configdefaults import config
 from pytensor.graph.basic import Apply
+from pytensor.link.c.cmodule import GCC_compiler
 from pytensor.link.c.op import COp, ExternalCOp
 from pytensor.link.c.params_type import Params, ParamsType
 from pytensor.link.c.type import EnumList, Generic
@@ -149,6 +155,38 @@ class TestParamsType:
         assert w1 == w2
         assert not (w1 != w2)
         assert hash(w1) == hash(w2)
+        assert type(w1) is type(w2)
+        assert w1.floatting == -4.5
+        # Params must survive a pickling round-trip.
+        w1_unpickled = pickle.loads(pickle.dumps(w1))
+        assert w1_unpickled == w1
+        assert hash(w1_unpickled) == hash(w1)
+
+        # Params pickled by older versions (plain Params instances) were rebuilt
+        # from their items and state.
+        class OldParamsPickler(pickle.Pickler):
+            def reducer_override(self, obj):
+                if not isinstance(obj, Params):
+                    return NotImplemented
+                return (
+                    copyreg.__newobj__,
+                    (Params,),
+                    obj.__dict__,
+                    None,
+                    iter(obj.items()),
+                )
+
+        old_w1 = Params.__new__(Params)
+        dict.update(old_w1, w1)
+        old_w1.__dict__.update(__params_type__=wp2, __signatures__=None)
+        buffer = io.BytesIO()
+        OldParamsPickler(buffer).dump(old_w1)
+        w1_unpickled = pickle.loads(buffer.getvalue())
+        assert type(w1_unpickled) is type(w1)
+        assert w1_unpickled == w1
+        assert hash(w1_unpickled) == hash(w1)
+        with pytest.raises(NotImplementedError):
+            w1_unpickled["a"] = 2
         # Changing attributes names only (a -> other_name).
         wp2_other = ParamsType(
             other_name=Generic(),
@@ -198,6 +236,10 @@ class TestParamsType:
         assert not (w1 != w2)
         assert hash(w1) == hash(w2)
         assert w1.name == w2.name
+        # Hash must survive a pickling round-trip.
+        w1_unpickled = pickle.loads(pickle.dumps(w1))
+        assert w1_unpickled == w1
+        assert hash(w1_unpickled) == hash(w1)
         # Changing attributes names only.
         w2 = ParamsType(
             a1=TensorType("int64", shape=(None, None)),
@@ -267,6 +309,10 @@ class TestParamsType:
         w.filter(o1, strict=False, allow_downcast=False)
         w.filter(o1, strict=False, allow_downcast=True)
 
+        # Params created by the params type are already filtered.
+        o_filtered = w.get_params(o)
+        assert w.filter(o_filtered, strict=True) is o_filtered
+
         # Check values_eq and values_eq_approx.
         o2 = Params(
             w,
@@ -290,6 +336,14 @@ class TestParamsType:
         )
         assert w.values_eq_approx(o1, o3)
 
+        # Unhashable values are accepted, hashing is only checked when needed.
+        w = ParamsType(g=Generic(), a=ScalarType("int32"))
+        o = w.get_params(g=[1, 2], a=1)
+        assert o.g == [1, 2]
+        assert w.filter(Params(w, g={"b": 2}, a=1)).g == {"b": 2}
+        with pytest.raises(TypeError, match="unhashable"):
+            hash(o)
+
     def test_params_type_with_enums(self):
         # Test that we fail if we create a params type with common enum names inside different enum types.
         try:
@@ -333,6 +387,25 @@ class TestParamsType:
         # Test that other regular wrapper attributes are still available.
         assert len(w.fields) == len(w.types) == w.length
         assert w.name
+        assert w.get_type("enum2") == EnumList(("D", "delta"), "E", "F")
+        assert w.get_field(EnumList("A", ("B", "beta"), "C")) == "enum1"
+        with pytest.raises(ValueError):
+            w.get_type("enum3")
+        with pytest.raises(ValueError):
+            w.get_field(EnumList("G", "H"))
+        # Unknown attributes raise a regular AttributeError.
+        with pytest.raises(AttributeError, match="has no attribute 'beta'"):
+            w.beta
+
+    def test_c_compile_args_follow_config(self):
+        w = ParamsType(x=ScalarType("float64"), y=ScalarType("int32"))
+        assert w.c_compile_args(c_compiler=GCC_compiler) == []
+        with config.change_flags(lib__amdlibm=True):
+            assert w.c_compile_args(c_compiler=GCC_compiler) == [
+                "-DREPLACE_WITH_AMDLIBM"
+            ]
+            assert w.c_libraries(c_compiler=GCC_compiler) == ["amdlibm"]
+        assert w.c_compile_args(c_compiler=GCC_compiler) == []
 
     def test_op_params(self):
         a, b, c = 2, 3, -7
@@ -6,6 +6,7 @@ import pytensor
 import pytensor.tensor as pt
 from pytensor.compile import get_mode
 from pytensor.configdefaults import config
+from pytensor.scalar import basic as ps
 from pytensor.tensor import elemwise as pt_elemwise
 from pytensor.tensor.math import all as pt_all
 from pytensor.tensor.math import prod
@@ -16,6 +17,11 @@ from tests.link.jax.test_basic import compare_jax_and_py
 from tests.tensor.test_elemwise import check_elemwise_runtime_broadcast
 
 
+jax = pytest.importorskip("jax")
+
+from pytensor.link.jax.dispatch import jax_funcify  # noqa: E402
+
+
 def test_elemwise_runtime_broadcast():
     check_elemwise_runtime_broadcast(get_mode("JAX"))
 
@@ -33,6 +39,11 @@ def test_jax_Dimshuffle():
         [a_pt], [x], [np.c_[[1.0, 2.0], [3.0, 4.0]].astype(config.floatX)]
     )
 
+    # Expanding dims should not be lowered to a reshape
+    jax_fn = jax.jit(jax_funcify(x.owner.op))
+    hlo = jax_fn.lower(np.c_[[1.0, 2.0], [3.0, 4.0]].astype(config.floatX)).as_text()
+    assert "reshape" not in hlo
+
     a_pt = tensor(dtype=config.floatX, shape=(None, 1))
     x = a_pt.dimshuffle((0,))
     compare_jax_and_py([a_pt], [x], [np.c_[[1.0, 2.0, 3.0, 4.0]].astype(config.floatX)])
@@ -73,6 +84,31 @@ def test_jax_CAReduce():
     compare_jax_and_py([a_pt], [x], [np.c_[[1, 2, 3], [1, 2, 3]].astype(config.floatX)])
 
 
+@pytest.mark.parametrize(
+    "scalar_op, dtype",
+    [
+        (ps.add, config.floatX),
+        (ps.mul, config.floatX),
+        (ps.scalar_maximum, config.floatX),
+        (ps.scalar_minimum, config.floatX),
+        (ps.and_, "bool"),
+        (ps.or_, "bool"),
+        (ps.xor, "int32"),
+    ],
+)
+@pytest.mark.parametrize("axis", [None, 0, 1])
+def test_jax_CAReduce_scalar_op(scalar_op, dtype, axis):
+    a_pt = matrix("a", dtype=dtype)
+    x = pt_elemwise.CAReduce(scalar_op, axis=axis)(a_pt)
+
+    a_test = np.c_[[1, 2, 3], [1, 0, 3]].astype(dtype)
+    compare_jax_and_py([a_pt], [x], [a_test])
+
+    # A dedicated reduction primitive is used, not a generic `reduce`
+    jaxpr = jax.make_jaxpr(jax_funcify(x.owner.op))(a_test)
+    assert jaxpr.eqns[0].primitive.name.startswith("reduce_")
+
+
 @pytest.mark.parametrize("axis", [None, 0, 1])
 def test_softmax(axis):
     x = matrix("x")
@@ -127,3 +163,25 @@ def test_multiple_input_multiply():
     x, y, z = vectors("xyz")
     out = pt.mul(x, y, z)
     compare_jax_and_py([x, y, z], [out], test_inputs=[[1.5], [2.5], [3.5]])
+
+    # Broadcasted inputs are multiplied pairwise, not stacked and reduced
+    x, y, z = matrix("x"), vector("y"), matrix("z", shape=(1, None))
+    out = pt.mul(x, y, z)
+    compare_jax_and_py(
+        [x, y, z],
+        [out],
+        test_inputs=[
+            np.full((2, 3), 1.5, dtype=config.floatX),
+            np.full((3,), 2.5, dtype=config.floatX),
+            np.full((1, 3), 3.5, dtype=config.floatX),
+        ],
+    )
+    jax_fn = jax.jit(jax_funcify(out.owner.op, node=out.owner))
+    hlo = jax_fn.lower(
+        *(
+            jax.ShapeDtypeStruct(shape, config.floatX)
+            for shape in [(2, 3), (3,), (1, 3)]
+        )
+    ).as_text()
+    assert "concatenate" not in hlo
+    assert "reduce" not in hlo
@@ -2,14 +2,18 @@ import numpy as np
 import pytest
 
 from pytensor.configdefaults import config
-from pytensor.tensor.math import Argmax, Max, maximum
+from pytensor.tensor.basic import switch
+from pytensor.tensor.math import Argmax, Max, exp, isinf, log, logsumexp, maximum
 from pytensor.tensor.math import max as pt_max
-from pytensor.tensor.type import dvector, matrix, scalar, vector
+from pytensor.tensor.math import sum as pt_sum
+from pytensor.tensor.type import dvector, matrix, scalar, tensor, vector
 from tests.link.jax.test_basic import compare_jax_and_py
 
 
 jax = pytest.importorskip("jax")
 
+from pytensor.link.jax.dispatch.math import JAXLogSumExp  # noqa: E402
+
 
 def test_jax_max_and_argmax():
     # Test that a single output of a multi-output `Op` can be used as input to
@@ -54,3 +58,63 @@ def test_dot():
 
     out = pt_max(y)
     compare_jax_and_py([y], [out], [y_test_value])
+
+
+@pytest.mark.parametrize("keepdims", [False, True])
+@pytest.mark.parametrize("axis", [None, 0, 1])
+def test_logsumexp(axis, keepdims):
+    x = matrix("x")
+    x_test_value = np.arange(6, dtype=config.floatX).reshape(2, 3)
+    out = logsumexp(x, axis=axis, keepdims=keepdims)
+
+    fn, _ = compare_jax_and_py([x], [out], [x_test_value])
+    assert any(isinstance(node.op, JAXLogSumExp) for node in fn.maker.fgraph.toposort())
+
+
+@pytest.mark.parametrize("axis", [None, 0, 1])
+def test_logsumexp_manually_stabilized(axis):
+    x = matrix("x")
+    x_test_value = np.array([[1.0, 2.0, 3.0], [-np.inf, -np.inf, -np.inf]])
+    x_max = pt_max(x, axis=axis, keepdims=True)
+    x_max = switch(isinf(x_max), 0, x_max)
+    out = log(pt_sum(exp(x - x_max), axis=axis, keepdims=True)) + x_max
+
+    fn, _ = compare_jax_and_py([x], [out], [x_test_value.astype(config.floatX)])
+    # The offset is removed, only the expand dims of keepdims=True remains
+    lse_node, _ = fn.maker.fgraph.toposort()
+    assert isinstance(lse_node.op, JAXLogSumExp)
+    assert lse_node.inputs == fn.maker.fgraph.inputs
+
+
+@pytest.mark.parametrize(
+    "x_shape, offset_shape, make_out",
+    [
+        # The result is not expanded back in the reduced axis
+        (
+            (None, None, None),
+            (1, None, 1),
+            lambda x, c: log(pt_sum(exp(x - c), axis=0))[:, :, None] + c,
+        ),
+        # The offset broadcasts x
+        (
+            (1, None),
+            (None, 1),
+            lambda x, c: log(pt_sum(exp(x - c), axis=1, keepdims=True)) + c,
+        ),
+    ],
+    ids=["misaligned_expand_dims", "offset_broadcasts_x"],
+)
+def test_logsumexp_offset_not_removed(x_shape, offset_shape, make_out):
+    x = tensor("x", shape=x_shape)
+    c = tensor("c", shape=offset_shape)
+    out = make_out(x, c)
+
+    rng = np.random.default_rng(1036)
+    x_test_value = rng.normal(size=[s or 3 for s in x_shape]).astype(config.floatX)
+    c_test_value = rng.normal(size=[s or 3 for s in offset_shape]).astype(config.floatX)
+    fn, _ = compare_jax_and_py([x, c], [out], [x_test_value, c_test_value])
+    # The offset is still subtracted before the logsumexp
+    [lse_node] = [
+        node for node in fn.maker.fgraph.toposort() if isinstance(node.op, JAXLogSumExp)
+    ]
+    assert lse_node.inputs[0] is not fn.maker.fgraph.inputs[0]